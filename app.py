@@ -1,19 +1,24 @@
 import streamlit as st
 import pandas as pd
 import os
+import shutil
+import threading
+import uuid
 from datetime import datetime
+from functools import lru_cache
 import numpy as np
-
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-
-def get_main_tag(tags, topic):
-    if isinstance(tags, str) and tags.strip():
-        return tags.split(",")[0].strip()
-    return str(topic) if isinstance(topic, str) else "this concept"
-
-def generate_summary_offline(title, topic, tags, level):
-    main_tag = get_main_tag(tags, topic)
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+def add_main_tag(videos):
+    # First concept tag, falling back to the topic when a video has no tags.
+    tags = videos["concept_tags"]
+    has_tags = tags.fillna("").str.strip() != ""
+    first_tag = tags.str.split(",", n=1).str[0].str.strip()
+    fallback = videos["topic"].astype("string").fillna("this concept")
+    return videos.assign(main_tag=first_tag.where(has_tags, fallback))
+
+def generate_summary_offline(title, topic, main_tag, level):
     level = (level or "Beginner").strip()
 
     if level.lower() == "beginner":
@@ -23,8 +28,7 @@ def generate_summary_offline(title, topic, tags, level):
     else:
         return f"This reel focuses on advanced aspects of {main_tag} and how it is used in real problems related to {topic}."
 
-def generate_quiz_offline(title, topic, tags, level):
-    main_tag = get_main_tag(tags, topic)
+def generate_quiz_offline(title, topic, main_tag, level):
     level = (level or "Beginner").strip()
 
     questions = []
@@ -59,19 +63,78 @@ def generate_quiz_offline(title, topic, tags, level):
 
     return questions
 
-def generate_practice_offline(title, topic, tags, level):
-    main_tag = get_main_tag(tags, topic)
+def generate_practice_offline(title, topic, main_tag, level):
     return (
         f"In 3–4 lines, explain {main_tag} in your own words and give one simple example "
         f"from the topic {topic}."
     )
 
-VIDEO_CSV = "videos.csv"
-COURSE_CSV = "courses.csv"
-PROGRESS_CSV = "progress.csv"
-COMMENTS_CSV = "comments.csv"
-POLLS_CSV = "polls.csv"
-POLL_VOTES_CSV = "poll_votes.csv"
+# Every table is an append-only dataset: a directory holding at most one
+# compacted base file plus the part files written per insert since then.
+# File names carry a per-dataset sequence number so sorting gives insert order.
+DATASET_MAX_PARTS = 32
+VIDEO_DATASET = "videos"
+COURSE_DATASET = "courses"
+PROGRESS_DATASET = "progress"
+COMMENTS_DATASET = "comments"
+POLLS_DATASET = "polls"
+POLL_VOTES_DATASET = "poll_votes"
+
+VIDEO_SCHEMA = pa.schema([
+    ("video_id", pa.string()),
+    ("title", pa.string()),
+    ("topic", pa.string()),
+    ("concept_tags", pa.string()),
+    ("level", pa.string()),
+    ("course_id", pa.string()),
+    ("url", pa.string()),
+    ("duration_sec", pa.int64()),
+])
+COURSE_SCHEMA = pa.schema([
+    ("course_id", pa.string()),
+    ("course_name", pa.string()),
+    ("description", pa.string()),
+    ("level", pa.string()),
+    ("topic", pa.string()),
+])
+PROGRESS_SCHEMA = pa.schema([
+    ("user_id", pa.string()),
+    ("course_id", pa.string()),
+    ("video_id", pa.string()),
+    ("watched", pa.int64()),
+])
+COMMENTS_SCHEMA = pa.schema([
+    ("video_id", pa.string()),
+    ("user_id", pa.string()),
+    ("text", pa.string()),
+    ("is_creator", pa.int64()),
+    ("timestamp", pa.string()),
+])
+POLLS_SCHEMA = pa.schema([
+    ("poll_id", pa.string()),
+    ("video_id", pa.string()),
+    ("question", pa.string()),
+    ("option_1", pa.string()),
+    ("option_2", pa.string()),
+    ("option_3", pa.string()),
+    ("option_4", pa.string()),
+])
+POLL_VOTES_SCHEMA = pa.schema([
+    ("poll_id", pa.string()),
+    ("user_id", pa.string()),
+    ("chosen_option", pa.string()),
+])
+
+# Low-cardinality filter columns compare as integer codes; free text uses
+# arrow-backed strings.
+VIDEO_DTYPES = {
+    "topic": "category",
+    "level": "category",
+    "course_id": "category",
+    "title": "string[pyarrow]",
+    "concept_tags": "string[pyarrow]",
+    "url": "string[pyarrow]",
+}
 
 def load_or_create_csv(path, columns):
     if os.path.exists(path):
@@ -83,95 +146,251 @@ def load_or_create_csv(path, columns):
     else:
         return pd.DataFrame(columns=columns)
 
+@st.cache_resource
+def _dataset_lock(path):
+    return threading.Lock()
+
+def _stamp_of(name):
+    return name.split("-", 1)[1]
+
+def _next_stamp(path):
+    # A per-dataset sequence rather than wall-clock time, so a clock stepping
+    # backwards can't order a new part before the base that would hide it.
+    # Callers hold _dataset_lock(path).
+    seqs = [
+        int(_stamp_of(name).split("-", 1)[0])
+        for name in os.listdir(path)
+        if name.startswith(("part-", "base-"))
+    ]
+    return f"{max(seqs, default=0) + 1:020d}-{uuid.uuid4().hex}.parquet"
+
+def _live_files(path):
+    # The newest base covers every part stamped at or before it; anything
+    # older is left over from an interrupted compaction and is skipped.
+    names = sorted(os.listdir(path))
+    bases = [name for name in names if name.startswith("base-")]
+    stamp = _stamp_of(bases[-1]) if bases else ""
+    parts = [
+        name for name in names
+        if name.startswith("part-") and _stamp_of(name) > stamp
+    ]
+    return [os.path.join(path, name) for name in bases[-1:] + parts]
+
+def _read_files(files, schema):
+    if not files:
+        return schema.empty_table()
+    return pa.concat_tables([pq.read_table(f).cast(schema) for f in files])
+
+def _read_dataset(path, schema, attempts=3):
+    # The lock keeps same-process compaction from deleting files mid-read; a
+    # writer in another process can still do so, in which case list again.
+    with _dataset_lock(path):
+        for attempt in range(attempts):
+            try:
+                return _read_files(_live_files(path), schema)
+            except FileNotFoundError:
+                if attempt == attempts - 1:
+                    raise
+
+def load_or_create_dataset(path, schema, dtypes=None):
+    if os.path.isdir(path):
+        df = _read_dataset(path, schema).to_pandas()
+    else:
+        # Not migrated yet: read the legacy CSV of the same name.
+        df = load_or_create_csv(path + ".csv", schema.names)
+    return df.astype(dtypes) if dtypes else df
+
+def _write_file(table, path, name):
+    # Written under a temporary name and renamed, so readers never see a
+    # partially written file.
+    tmp = os.path.join(path, f".tmp-{uuid.uuid4().hex}")
+    pq.write_table(table, tmp, compression="zstd")
+    os.replace(tmp, os.path.join(path, name))
+
+def _df_to_table(df, schema):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    return table.select(schema.names).cast(schema)
+
+def _create_dataset(path, schema):
+    # Seed a scratch directory with the legacy rows and rename it into place,
+    # so a crash or a concurrent first write can't duplicate or hide them.
+    tmp = f"{path}.tmp-{uuid.uuid4().hex}"
+    os.makedirs(tmp)
+    existing = load_or_create_csv(path + ".csv", schema.names)
+    if not existing.empty:
+        _write_file(_df_to_table(existing, schema), tmp, "base-" + _next_stamp(tmp))
+    try:
+        os.rename(tmp, path)
+    except OSError:
+        # Another writer created the dataset first.
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def _compact(path, schema):
+    files = _live_files(path)
+    parts = [f for f in files if os.path.basename(f).startswith("part-")]
+    if len(parts) <= DATASET_MAX_PARTS:
+        return
+
+    # The new base takes the stamp of the last part it merges; files stamped
+    # up to it are then redundant, including leftovers from earlier attempts.
+    stamp = _stamp_of(os.path.basename(parts[-1]))
+    base = "base-" + stamp
+    _write_file(_read_files(files, schema), path, base)
+    for name in os.listdir(path):
+        if name.startswith(("part-", "base-")) and name != base and _stamp_of(name) <= stamp:
+            try:
+                os.remove(os.path.join(path, name))
+            except FileNotFoundError:
+                pass
+
+def append_row(path, row, schema):
+    with _dataset_lock(path):
+        if not os.path.isdir(path):
+            _create_dataset(path, schema)
+        table = _df_to_table(pd.DataFrame([row], columns=schema.names), schema)
+        _write_file(table, path, "part-" + _next_stamp(path))
+        _compact(path, schema)
+
+def get_mtime(path):
+    # Part of the cache key for the loader below, so any write to a table
+    # (or to the legacy CSV it falls back to) invalidates its cached frame.
+    for candidate in (path, path + ".csv"):
+        if os.path.exists(candidate):
+            return os.stat(candidate).st_mtime_ns
+    return None
+
+@st.cache_data(max_entries=32)
+def _load_dataset(path, _schema, mtime):
+    return load_or_create_dataset(path, _schema)
+
+def load_dataset(path, schema):
+    return _load_dataset(path, schema, get_mtime(path))
+
+@st.cache_data(max_entries=4)
+def _load_videos(mtime):
+    videos = load_or_create_dataset(VIDEO_DATASET, VIDEO_SCHEMA, VIDEO_DTYPES)
+    return add_main_tag(videos)
+
+def load_videos():
+    return _load_videos(get_mtime(VIDEO_DATASET))
+
 def load_data():
-    videos = load_or_create_csv(
-        VIDEO_CSV,
-        ["video_id", "title", "topic", "concept_tags", "level",
-         "course_id", "url", "duration_sec"]
-    )
+    videos = load_videos()
 
-    courses = load_or_create_csv(
-        COURSE_CSV,
-        ["course_id", "course_name", "description", "level", "topic"]
-    )
+    courses = load_dataset(COURSE_DATASET, COURSE_SCHEMA)
 
-    progress = load_or_create_csv(
-        PROGRESS_CSV,
-        ["user_id", "course_id", "video_id", "watched"]
-    )
+    progress = load_dataset(PROGRESS_DATASET, PROGRESS_SCHEMA)
 
-    comments = load_or_create_csv(
-        COMMENTS_CSV,
-        ["video_id", "user_id", "text", "is_creator", "timestamp"]
-    )
+    comments = load_dataset(COMMENTS_DATASET, COMMENTS_SCHEMA)
 
-    polls = load_or_create_csv(
-        POLLS_CSV,
-        ["poll_id", "video_id", "question",
-         "option_1", "option_2", "option_3", "option_4"]
-    )
+    polls = load_dataset(POLLS_DATASET, POLLS_SCHEMA)
 
-    poll_votes = load_or_create_csv(
-        POLL_VOTES_CSV,
-        ["poll_id", "user_id", "chosen_option"]
-    )
+    poll_votes = load_dataset(POLL_VOTES_DATASET, POLL_VOTES_SCHEMA)
 
     return videos, courses, progress, comments, polls, poll_votes
 
-def save_data(videos, courses, progress, comments, polls, poll_votes):
-    videos.to_csv(VIDEO_CSV, index=False)
-    courses.to_csv(COURSE_CSV, index=False)
-    progress.to_csv(PROGRESS_CSV, index=False)
-    comments.to_csv(COMMENTS_CSV, index=False)
-    polls.to_csv(POLLS_CSV, index=False)
-    poll_votes.to_csv(POLL_VOTES_CSV, index=False)
+FEED_COLUMNS = ["video_id", "title", "topic", "level",
+                "duration_sec", "concept_tags", "url", "course_id", "main_tag"]
+
+@lru_cache(maxsize=4096)
+def normalize_url(url):
+    if "youtube.com/shorts/" in url:
+        try:
+            vid_id = url.split("shorts/")[1].split("?")[0].split("/")[0]
+            return f"https://www.youtube.com/watch?v={vid_id}"
+        except Exception:
+            pass
+    return url
 
 def get_current_user():
     if "user_id" not in st.session_state:
         st.session_state.user_id = "demo_user"
     return st.session_state.user_id
 
-def build_recommendations(videos, progress, user_id, top_n=10):
-    if videos.empty:
-        return videos
+FEED_PAGE_SIZE = 5
+
+def reset_feed_page(filters):
+    if st.session_state.get("feed_filters") != filters:
+        st.session_state.feed_filters = filters
+        st.session_state.page = 0
+
+def turn_feed_page(step):
+    st.session_state.page += step
+
+# Stateless feature hashing: new videos are vectorized without rebuilding a
+# vocabulary, so one shared instance serves every rerun. sklearn is imported
+# here rather than at module level since only the Learn feed needs it.
+@st.cache_resource
+def get_vectorizer():
+    from sklearn.feature_extraction.text import HashingVectorizer
 
-    texts = (
-        videos["title"].fillna("") + " " +
-        videos["topic"].fillna("") + " " +
-        videos["concept_tags"].fillna("")
+    # float32 is ample for cosine scores and halves the bytes the matvec reads.
+    return HashingVectorizer(
+        n_features=2**18, norm="l2", alternate_sign=False, ngram_range=(1, 2),
+        dtype=np.float32,
     )
 
-    vectorizer = TfidfVectorizer()
-    tfidf_matrix = vectorizer.fit_transform(texts)
+# Only the current corpus is ever needed; a new upload evicts the old matrix.
+@st.cache_resource(max_entries=1)
+def _vectorize_texts(texts):
+    return get_vectorizer().transform(texts)
+
+def compute_profile(videos, video_matrix, progress, user_id):
+    from sklearn.preprocessing import normalize
 
     user_watched = progress[
         (progress["user_id"] == user_id) & (progress["watched"] == 1)
     ]
 
-    if len(user_watched["video_id"].unique()) < 2:
-        return videos
+    watched_ids = user_watched["video_id"].unique()
+    if len(watched_ids) < 2:
+        return watched_ids, None
 
-    watched_ids = user_watched["video_id"].unique().tolist()
     watched_idx = videos[videos["video_id"].isin(watched_ids)].index.tolist()
-
     if not watched_idx:
+        return watched_ids, None
+
+    watched_vectors = video_matrix[watched_idx]
+    return watched_ids, normalize(np.asarray(watched_vectors.mean(axis=0)))
+
+def get_user_profile(videos, video_matrix, progress, user_id):
+    # Hashed video vectors depend only on their text, so the profile stays
+    # valid until the user marks another reel as watched.
+    if "profile_vec" not in st.session_state or st.session_state.get("profile_dirty"):
+        st.session_state.watched_ids, st.session_state.profile_vec = compute_profile(
+            videos, video_matrix, progress, user_id
+        )
+        st.session_state.profile_dirty = False
+    return st.session_state.watched_ids, st.session_state.profile_vec
+
+def build_recommendations(videos, progress, user_id, top_n=10):
+    if videos.empty:
         return videos
 
-    watched_vectors = tfidf_matrix[watched_idx]
-    user_profile_vec = watched_vectors.mean(axis=0)
-    user_profile_vec = np.asarray(user_profile_vec).reshape(1, -1)
+    texts = videos["title"].str.cat(
+        [videos["topic"], videos["concept_tags"]], sep=" ", na_rep=""
+    ).tolist()
 
-    sims = cosine_similarity(user_profile_vec, tfidf_matrix).ravel()
+    video_matrix = _vectorize_texts(tuple(texts))
 
-    videos_copy = videos.copy()
-    videos_copy["similarity"] = sims
+    watched_ids, user_profile_vec = get_user_profile(videos, video_matrix, progress, user_id)
+    if user_profile_vec is None:
+        return videos
 
-    videos_copy = videos_copy[~videos_copy["video_id"].isin(watched_ids)]
-    videos_copy = videos_copy[videos_copy["similarity"] > 0]
+    # Rows of video_matrix are already unit-norm, so the dot product with the
+    # normalized profile is the cosine similarity.
+    sims = np.asarray(video_matrix @ user_profile_vec.T).ravel()
 
-    videos_copy = videos_copy.sort_values("similarity", ascending=False)
+    mask = (sims > 0) & ~videos["video_id"].isin(watched_ids).to_numpy()
+    candidate_idx = np.flatnonzero(mask)
 
-    return videos_copy.head(top_n)
+    # Only top_n rows are shown: select them in O(N), then sort just those.
+    if len(candidate_idx) > top_n:
+        partition = np.argpartition(-sims[candidate_idx], top_n - 1)[:top_n]
+        candidate_idx = candidate_idx[partition]
+    top_idx = candidate_idx[np.argsort(-sims[candidate_idx], kind="stable")]
+
+    return videos.iloc[top_idx].assign(similarity=sims[top_idx])
 
 st.set_page_config(page_title="SkillScroll – Bite-Sized Learning", layout="wide")
 st.title("SkillScroll – Bite-Sized Learning App")
@@ -186,8 +405,8 @@ st.sidebar.write(f"Logged in as: `{user_id}` (demo)")
 if mode == "Learn":
     st.subheader("🎓 Personalized Learning Feed")
 
-    topics = ["All"] + sorted([t for t in videos["topic"].dropna().unique().tolist()])
-    levels = ["All"] + sorted([l for l in videos["level"].dropna().unique().tolist()])
+    topics = ["All"] + sorted(videos["topic"].dropna().unique())
+    levels = ["All"] + sorted(videos["level"].dropna().unique())
 
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -197,126 +416,146 @@ if mode == "Learn":
     with col3:
         feed_type = st.selectbox("Feed Type", ["Recommended For You (ML)", "All Videos"])
 
+    reset_feed_page((topic_filter, level_filter, feed_type))
+
     if videos.empty:
         st.info("No videos yet. Ask a creator to upload from the Creator Studio.")
     else:
         if feed_type == "Recommended For You (ML)":
             feed = build_recommendations(videos, progress, user_id, top_n=20)
             if feed.empty:
-                feed = videos.copy()
+                feed = videos
         else:
-            feed = videos.copy()
+            feed = videos
 
+        # Combine the filters into one mask so the feed is sliced at most once.
+        mask = np.ones(len(feed), dtype=bool)
         if topic_filter != "All":
-            feed = feed[feed["topic"] == topic_filter]
+            mask &= (feed["topic"] == topic_filter).to_numpy()
         if level_filter != "All":
-            feed = feed[feed["level"] == level_filter]
+            mask &= (feed["level"] == level_filter).to_numpy()
+        feed_idx = np.flatnonzero(mask)
 
-        if feed.empty:
+        if feed_idx.size == 0:
             st.warning("No videos match the current filters.")
         else:
-            for _, row in feed.iterrows():
+            # Only one page of reels (and their widgets) is rendered per rerun.
+            n_pages = -(-feed_idx.size // FEED_PAGE_SIZE)
+            page = min(st.session_state.page, n_pages - 1)
+            st.session_state.page = page
+            start = page * FEED_PAGE_SIZE
+            feed = feed.iloc[feed_idx[start:start + FEED_PAGE_SIZE]]
+
+            # Narrow the side tables to this page's reels in one vectorized pass,
+            # then index what's left so each reel is a dict lookup.
+            page_vids = feed["video_id"].to_numpy()
+            page_comments = comments[comments["video_id"].isin(page_vids)]
+            no_comments = page_comments.iloc[0:0]
+            comments_by_vid = dict(tuple(
+                page_comments.sort_values("timestamp", kind="stable").groupby("video_id")
+            ))
+            first_polls = polls[polls["video_id"].isin(page_vids)].drop_duplicates("video_id")
+            polls_by_vid = dict(zip(first_polls["video_id"], first_polls.to_dict("records")))
+            user_votes = poll_votes[
+                (poll_votes["user_id"] == user_id) &
+                poll_votes["poll_id"].isin(first_polls["poll_id"])
+            ].drop_duplicates("poll_id")
+            user_vote_by_poll = dict(zip(user_votes["poll_id"], user_votes["chosen_option"]))
+            course_by_id = {
+                str(c["course_id"]): c
+                for c in courses.drop_duplicates("course_id").to_dict("records")
+            }
+
+            # Fill missing display values in one pass; -1 marks an unknown duration.
+            feed_view = feed[FEED_COLUMNS].assign(
+                duration_sec=feed["duration_sec"].fillna(-1).astype("int32"),
+                concept_tags=feed["concept_tags"].fillna(""),
+                url=feed["url"].fillna("").str.strip(),
+            )
+            feed_rows = feed_view.itertuples(index=False, name=None)
+            for (video_id, title, topic, level, duration_sec,
+                 concept_tags, url, course_id, main_tag) in feed_rows:
                 st.markdown("---")
-                st.markdown(f"### {row['title']}")
+                st.markdown(f"### {title}")
                 st.caption(
-                    f"Topic: {row['topic']} | Level: {row['level']} | "
-                    f"{int(row['duration_sec']) if pd.notna(row['duration_sec']) else '--'} sec"
+                    f"Topic: {topic} | Level: {level} | "
+                    f"{duration_sec if duration_sec >= 0 else '--'} sec"
                 )
-                st.caption(f"Tags: {row['concept_tags'] if pd.notna(row['concept_tags']) else '-'}")
+                st.caption(f"Tags: {concept_tags or '-'}")
 
-                url = str(row["url"]).strip() if pd.notna(row["url"]) else ""
                 if url:
-                    if "youtube.com/shorts/" in url:
-                        try:
-                            vid_id = url.split("shorts/")[1].split("?")[0].split("/")[0]
-                            url = f"https://www.youtube.com/watch?v={vid_id}"
-                        except Exception:
-                            pass
-                    st.video(url)
+                    st.video(normalize_url(url))
 
                 c1, c2 = st.columns(2)
-                if c1.button("✅ Mark as Watched", key=f"watch_{row['video_id']}"):
+                if c1.button("✅ Mark as Watched", key=f"watch_{video_id}"):
                     new_row = {
                         "user_id": user_id,
-                        "course_id": row["course_id"],
-                        "video_id": row["video_id"],
+                        "course_id": course_id,
+                        "video_id": video_id,
                         "watched": 1,
                     }
-                    progress = pd.concat([progress, pd.DataFrame([new_row])], ignore_index=True)
-                    save_data(videos, courses, progress, comments, polls, poll_votes)
+                    append_row(PROGRESS_DATASET, new_row, PROGRESS_SCHEMA)
+                    st.session_state.profile_dirty = True
                     st.success("Marked as watched.")
 
-                if c2.button("📚 Go to Course", key=f"goto_{row['video_id']}"):
-                    course_id = row["course_id"]
-                    if pd.isna(course_id) or course_id not in courses["course_id"].astype(str).tolist():
+                if c2.button("📚 Go to Course", key=f"goto_{video_id}"):
+                    if pd.isna(course_id) or str(course_id) not in course_by_id:
                         st.warning("This reel is not linked to any micro-course.")
                     else:
-                        course_row = courses[courses["course_id"] == course_id].iloc[0]
+                        course_row = course_by_id[str(course_id)]
                         st.info(
                             f"Micro-course: **{course_row['course_name']}** "
                             f"(Topic: {course_row['topic']}, Level: {course_row['level']})"
                         )
                         course_videos = videos[videos["course_id"] == course_id]
-                        for _, v in course_videos.iterrows():
-                            st.markdown(f"- {v['title']} ({v['duration_sec']} sec)")
+                        course_rows = course_videos[["title", "duration_sec"]].itertuples(index=False, name=None)
+                        for v_title, v_duration in course_rows:
+                            st.markdown(f"- {v_title} ({v_duration} sec)")
 
                 st.markdown("**💬 Comments & Q&A**")
-                video_comments = comments[comments["video_id"] == row["video_id"]]
+                video_comments = comments_by_vid.get(video_id, no_comments)
 
                 if video_comments.empty:
                     st.caption("No comments yet. Be the first to ask a question!")
                 else:
-                    for _, c in video_comments.sort_values("timestamp").iterrows():
-                        prefix = "Creator" if str(c["is_creator"]) == "1" else "Learner"
-                        st.markdown(f"- **{prefix}:** {c['text']}")
+                    comment_rows = video_comments[["is_creator", "text"]]
+                    for is_creator, text in comment_rows.itertuples(index=False, name=None):
+                        prefix = "Creator" if str(is_creator) == "1" else "Learner"
+                        st.markdown(f"- **{prefix}:** {text}")
 
                 new_comment = st.text_input(
                     "Add a comment or question",
-                    key=f"comment_{row['video_id']}"
+                    key=f"comment_{video_id}"
                 )
-                if st.button("Post Comment", key=f"post_{row['video_id']}"):
+                if st.button("Post Comment", key=f"post_{video_id}"):
                     if new_comment.strip():
                         new_row = {
-                            "video_id": row["video_id"],
+                            "video_id": video_id,
                             "user_id": user_id,
                             "text": new_comment.strip(),
                             "is_creator": 0,
                             "timestamp": datetime.now().isoformat(),
                         }
-                        comments = pd.concat([comments, pd.DataFrame([new_row])], ignore_index=True)
-                        save_data(videos, courses, progress, comments, polls, poll_votes)
+                        append_row(COMMENTS_DATASET, new_row, COMMENTS_SCHEMA)
                         st.success("Comment posted.")
                     else:
                         st.error("Comment cannot be empty.")
 
                 st.markdown("**📊 Quick Poll**")
-                poll_row = polls[polls["video_id"] == row["video_id"]]
-                if poll_row.empty:
+                poll_row = polls_by_vid.get(video_id)
+                if poll_row is None:
                     st.caption("No poll for this reel.")
                 else:
-                    poll_row = poll_row.iloc[0]
-                    options = []
-                    labels = []
-                    if isinstance(poll_row["option_1"], str) and poll_row["option_1"]:
-                        options.append("option_1")
-                        labels.append(poll_row["option_1"])
-                    if isinstance(poll_row["option_2"], str) and poll_row["option_2"]:
-                        options.append("option_2")
-                        labels.append(poll_row["option_2"])
-                    if isinstance(poll_row["option_3"], str) and poll_row["option_3"]:
-                        options.append("option_3")
-                        labels.append(poll_row["option_3"])
-                    if isinstance(poll_row["option_4"], str) and poll_row["option_4"]:
-                        options.append("option_4")
-                        labels.append(poll_row["option_4"])
-
-                    if options:
-                        user_prev_vote = poll_votes[
-                            (poll_votes["poll_id"] == poll_row["poll_id"]) &
-                            (poll_votes["user_id"] == user_id)
-                        ]
-                        if not user_prev_vote.empty:
-                            st.caption(f"You already voted: {user_prev_vote.iloc[0]['chosen_option']}")
+                    labels = [
+                        option
+                        for option in (poll_row[f"option_{i}"] for i in (1, 2, 3, 4))
+                        if isinstance(option, str) and option
+                    ]
+
+                    if labels:
+                        user_prev_vote = user_vote_by_poll.get(poll_row["poll_id"])
+                        if user_prev_vote is not None:
+                            st.caption(f"You already voted: {user_prev_vote}")
                         else:
                             choice = st.radio(
                                 poll_row["question"],
@@ -329,44 +568,52 @@ if mode == "Learn":
                                     "user_id": user_id,
                                     "chosen_option": choice,
                                 }
-                                poll_votes = pd.concat(
-                                    [poll_votes, pd.DataFrame([new_vote])],
-                                    ignore_index=True
-                                )
-                                save_data(videos, courses, progress, comments, polls, poll_votes)
+                                append_row(POLL_VOTES_DATASET, new_vote, POLL_VOTES_SCHEMA)
                                 st.success("Thanks for voting!")
                     else:
                         st.caption("Poll has no options configured.")
 
                                 # ---------- AI Learning Assistant (optional) ----------
                 with st.expander("🧠 AI Learning Assistant"):
-                    summary = generate_summary_offline(
-                        row["title"], row["topic"], row["concept_tags"], row["level"]
-                    )
+                    summary = generate_summary_offline(title, topic, main_tag, level)
                     st.markdown(f"**Summary:** {summary}")
 
-                    quiz = generate_quiz_offline(
-                        row["title"], row["topic"], row["concept_tags"], row["level"]
-                    )
+                    quiz = generate_quiz_offline(title, topic, main_tag, level)
                     st.markdown("**Quick Quiz:**")
                     for i, q in enumerate(quiz):
                         st.markdown(f"**Q{i+1}. {q['q']}**")
                         user_choice = st.radio(
                             "Choose an option:",
                             q["options"],
-                            key=f"quiz_{row['video_id']}_{i}",
+                            key=f"quiz_{video_id}_{i}",
                         )
-                        if st.button("Check", key=f"check_{row['video_id']}_{i}"):
+                        if st.button("Check", key=f"check_{video_id}_{i}"):
                             if user_choice == q["answer"]:
                                 st.success("Correct ✅")
                             else:
                                 st.error(f"Incorrect ❌. Correct answer: {q['answer']}")
 
-                    practice = generate_practice_offline(
-                        row["title"], row["topic"], row["concept_tags"], row["level"]
-                    )
+                    practice = generate_practice_offline(title, topic, main_tag, level)
                     st.markdown("**Practice Question:**")
                     st.write(practice)
+
+            st.markdown("---")
+            prev_col, page_col, next_col = st.columns(3)
+            prev_col.button(
+                "⬅️ Previous",
+                key="feed_prev",
+                on_click=turn_feed_page,
+                args=(-1,),
+                disabled=page == 0,
+            )
+            page_col.caption(f"Page {page + 1} of {n_pages}")
+            next_col.button(
+                "Next ➡️",
+                key="feed_next",
+                on_click=turn_feed_page,
+                args=(1,),
+                disabled=page >= n_pages - 1,
+            )
 elif mode == "My Courses":
     st.subheader("📚 My Micro-Courses")
 
@@ -377,30 +624,36 @@ elif mode == "My Courses":
     if user_progress.empty:
         st.info("You have not watched any reels yet. Start from the Learn tab.")
     else:
-        course_ids = user_progress["course_id"].dropna().unique().tolist()
+        course_ids = user_progress["course_id"].dropna().unique()
         my_courses = courses[courses["course_id"].isin(course_ids)]
 
         if my_courses.empty:
             st.info("You have watched reels that are not linked to any micro-course.")
         else:
-            for _, c in my_courses.iterrows():
-                course_videos = videos[videos["course_id"] == c["course_id"]]
-                watched_vids = user_progress[user_progress["course_id"] == c["course_id"]]
+            course_rows = my_courses[["course_id", "course_name", "topic", "level"]].itertuples(
+                index=False, name=None
+            )
+            for c_id, c_name, c_topic, c_level in course_rows:
+                course_videos = videos[videos["course_id"] == c_id]
+                watched_vids = user_progress[user_progress["course_id"] == c_id]
                 total = len(course_videos)
-                done = len(watched_vids["video_id"].unique())
+                done = watched_vids["video_id"].nunique()
                 progress_value = done / total if total > 0 else 0
 
                 st.markdown("---")
-                st.markdown(f"### {c['course_name']}")
-                st.caption(f"Topic: {c['topic']} | Level: {c['level']}")
+                st.markdown(f"### {c_name}")
+                st.caption(f"Topic: {c_topic} | Level: {c_level}")
                 st.progress(progress_value)
 
-                if st.button("View Videos", key=f"view_{c['course_id']}"):
-                    for _, v in course_videos.iterrows():
-                        watched_flag = "✅" if v["video_id"] in watched_vids["video_id"].values else "⭕"
+                if st.button("View Videos", key=f"view_{c_id}"):
+                    video_rows = course_videos[["video_id", "title", "duration_sec"]].itertuples(
+                        index=False, name=None
+                    )
+                    for v_id, v_title, v_duration in video_rows:
+                        watched_flag = "✅" if v_id in watched_vids["video_id"].values else "⭕"
                         st.markdown(
-                            f"- {watched_flag} {v['title']} "
-                            f"({v['duration_sec']} sec)"
+                            f"- {watched_flag} {v_title} "
+                            f"({v_duration} sec)"
                         )
 
 elif mode == "Creator Studio":
@@ -428,8 +681,7 @@ elif mode == "Creator Studio":
                     "level": new_course_level,
                     "topic": new_course_topic.strip(),
                 }
-                courses = pd.concat([courses, pd.DataFrame([new_row])], ignore_index=True)
-                save_data(videos, courses, progress, comments, polls, poll_votes)
+                append_row(COURSE_DATASET, new_row, COURSE_SCHEMA)
                 st.success("Micro-course created. Select it from the dropdown above.")
             else:
                 st.error("Course name is required.")
@@ -500,11 +752,7 @@ elif mode == "Creator Studio":
                     "url": url.strip(),
                     "duration_sec": int(duration),
                 }
-
-                if "concept_tags" not in videos.columns:
-                    videos["concept_tags"] = ""
-
-                videos = pd.concat([videos, pd.DataFrame([new_vid])], ignore_index=True)
+                append_row(VIDEO_DATASET, new_vid, VIDEO_SCHEMA)
 
                 if add_poll and poll_question and (poll_opt1 or poll_opt2):
                     poll_id = f"poll_{len(polls) + 1}"
@@ -517,9 +765,10 @@ elif mode == "Creator Studio":
                         "option_3": poll_opt3.strip() if poll_opt3 else "",
                         "option_4": poll_opt4.strip() if poll_opt4 else "",
                     }
-                    polls = pd.concat([polls, pd.DataFrame([poll_row])], ignore_index=True)
+                    append_row(POLLS_DATASET, poll_row, POLLS_SCHEMA)
 
-                save_data(videos, courses, progress, comments, polls, poll_votes)
+                # The write bumped the dataset mtime, so this reloads only videos.
+                videos = load_videos()
                 st.success("Reel uploaded to micro-course!")
 
         st.markdown("---")
@@ -528,8 +777,11 @@ elif mode == "Creator Studio":
         if course_videos.empty:
             st.caption("No reels in this course yet.")
         else:
-            for _, v in course_videos.iterrows():
+            video_rows = course_videos[["title", "duration_sec", "topic", "level"]].itertuples(
+                index=False, name=None
+            )
+            for v_title, v_duration, v_topic, v_level in video_rows:
                 st.markdown(
-                    f"- {v['title']} ({v['duration_sec']} sec) | "
-                    f"Topic: {v['topic']} | Level: {v['level']}"
+                    f"- {v_title} ({v_duration} sec) | "
+                    f"Topic: {v_topic} | Level: {v_level}"
                 )